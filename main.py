@@ -17,58 +17,289 @@ Description:
 """
 
 import sys
-import csv
 import warnings
+from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
+
+import numpy as np
 
 # Suppress sip deprecation warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 # PyQt5 imports
-from PyQt5.QtCore import Qt, QDate, QSize
+from PyQt5.QtCore import (
+    Qt, QDate, QSize, QTimer, QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
+    QObject, QThread, pyqtSignal
+)
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QLineEdit, QTableWidget, QTableWidgetItem,
+    QLabel, QPushButton, QLineEdit, QTableView,
     QTabWidget, QDialog, QFormLayout, QDateEdit, QMessageBox, QComboBox,
-    QFileDialog, QToolBar, QAction, QStatusBar, QDoubleSpinBox
+    QFileDialog, QToolBar, QAction, QStatusBar, QDoubleSpinBox, QProgressDialog
 )
 
 # Matplotlib imports for Dashboard
+import matplotlib
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+
+# Cheaper Agg rendering for the dashboard redraws
+matplotlib.rcParams.update({
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+})
 
 # ---------------------------------
 # Data Models (stored in memory)
 # ---------------------------------
 class Invoice:
+    __slots__ = ("id", "paid", "_customer", "_invoice_date", "_due_date", "_amount", "_id_str",
+                 "_customer_lower", "_customer_csv", "_invoice_date_str", "_due_date_str", "_amount_str")
     _id_counter = 1
 
     def __init__(self, customer, invoice_date, due_date, amount):
         self.id = Invoice._id_counter
+        self._id_str = str(self.id)
         Invoice._id_counter += 1
         self.customer = customer
         self.invoice_date = invoice_date
         self.due_date = due_date
         self.amount = amount
-        self.status = "Unpaid"  # or "Paid"
+        self.paid = False
+
+    # The setters keep the pre-formatted strings used by the table and CSV export in sync
+    @property
+    def customer(self):
+        return self._customer
+
+    @customer.setter
+    def customer(self, value):
+        self._customer = value
+        self._customer_lower = value.lower()
+        self._customer_csv = _csv_quote(value)
+
+    @property
+    def invoice_date(self):
+        return self._invoice_date
+
+    @invoice_date.setter
+    def invoice_date(self, value):
+        self._invoice_date = value
+        self._invoice_date_str = value.isoformat()  # YYYY-MM-DD
+
+    @property
+    def due_date(self):
+        return self._due_date
+
+    @due_date.setter
+    def due_date(self, value):
+        self._due_date = value
+        self._due_date_str = value.isoformat()
+
+    @property
+    def amount(self):
+        return self._amount
+
+    @amount.setter
+    def amount(self, value):
+        self._amount = value
+        self._amount_str = f"{value:.2f}"
 
     def mark_paid(self):
-        self.status = "Paid"
+        self.paid = True
+
+    def mark_unpaid(self):
+        self.paid = False
+
+    @property
+    def status(self):
+        """Display label for the paid flag."""
+        return "Paid" if self.paid else "Unpaid"
 
 
 class Expense:
+    __slots__ = ("id", "_category", "_description", "_date", "_amount", "_id_str",
+                 "_category_csv", "_description_lower", "_description_csv", "_date_str", "_amount_str")
     _id_counter = 1
 
     def __init__(self, category, description, date, amount):
         self.id = Expense._id_counter
+        self._id_str = str(self.id)
         Expense._id_counter += 1
         self.category = category
         self.description = description
         self.date = date
         self.amount = amount
 
+    # The setters keep the pre-formatted strings used by the table and CSV export in sync
+    @property
+    def category(self):
+        return self._category
+
+    @category.setter
+    def category(self, value):
+        self._category = value
+        self._category_csv = _csv_quote(value)
+
+    @property
+    def description(self):
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        self._description = value
+        self._description_lower = value.lower()
+        self._description_csv = _csv_quote(value)
+
+    @property
+    def date(self):
+        return self._date
+
+    @date.setter
+    def date(self, value):
+        self._date = value
+        self._date_str = value.isoformat()  # YYYY-MM-DD
+
+    @property
+    def amount(self):
+        return self._amount
+
+    @amount.setter
+    def amount(self, value):
+        self._amount = value
+        self._amount_str = f"{value:.2f}"
+
+
+@dataclass(frozen=True)
+class Totals:
+    """Snapshot of the aggregate figures shown on the dashboard and report tabs."""
+    total_invoiced: float
+    total_paid: float
+    total_expenses: float
+    net_profit: float
+    tax_due: float
+    paid_count: int
+    unpaid_count: int
+
+
+def _csv_quote(field):
+    """Quote a free-text CSV field the way csv.writer's QUOTE_MINIMAL would."""
+    if ',' in field or '"' in field or '\n' in field or '\r' in field:
+        return '"' + field.replace('"', '""') + '"'
+    return field
+
+
+def _compute_totals(amounts, paid_mask, expense_amounts):
+    """
+    Reduce the column arrays to (total_invoiced, total_paid, total_expenses).
+    The paid total is a masked sum, so no amounts[paid_mask] copy is made.
+    """
+    return (float(amounts.sum()),
+            float(amounts.sum(where=paid_mask)),
+            float(expense_amounts.sum()))
+
+
+def _ensure_capacity(array, size):
+    """Return array, or a geometrically grown copy of it if it holds fewer than size items."""
+    if size <= array.size:
+        return array
+    grown = np.empty(max(size, 2 * array.size, 16), dtype=array.dtype)
+    grown[:array.size] = array
+    return grown
+
+# ---------------------------------
+# Table Models (back the QTableViews in the tabs)
+# ---------------------------------
+class BaseTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of pre-formatted row tuples.
+    Subclasses define HEADERS, format_row() and filter_key().
+    """
+    HEADERS = []
+    FILTER_ROLE = Qt.UserRole  # lowercase search key, used by the proxy filter
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def format_row(self, obj):
+        raise NotImplementedError
+
+    def filter_key(self, obj):
+        raise NotImplementedError
+
+    def _make_row(self, obj):
+        # The filter key rides along after the displayed columns
+        return self.format_row(obj) + (self.filter_key(obj),)
+
+    def set_rows(self, objects):
+        """Replace the model contents, formatting every row once."""
+        self.beginResetModel()
+        self._rows = [self._make_row(obj) for obj in objects]
+        self.endResetModel()
+
+    def append_rows(self, objects):
+        """Append rows in a single insert instead of resetting the whole model."""
+        new_rows = [self._make_row(obj) for obj in objects]
+        if not new_rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+        self._rows.extend(new_rows)
+        self.endInsertRows()
+
+    def update_rows(self, objects, rows):
+        """Re-format the given rows in place, emitting dataChanged only for those rows."""
+        last_column = len(self.HEADERS) - 1
+        for obj, row in zip(objects, rows):
+            self._rows[row] = self._make_row(obj)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == self.FILTER_ROLE:
+            return self._rows[index.row()][-1]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class InvoiceTableModel(BaseTableModel):
+    HEADERS = ["ID", "Customer", "Invoice Date", "Due Date", "Amount", "Status"]
+
+    def format_row(self, invoice):
+        return (invoice._id_str, invoice.customer, invoice._invoice_date_str,
+                invoice._due_date_str, invoice._amount_str, invoice.status)
+
+    def filter_key(self, invoice):
+        return invoice._customer_lower
+
+
+class ExpenseTableModel(BaseTableModel):
+    HEADERS = ["ID", "Category", "Description", "Date", "Amount"]
+
+    def format_row(self, expense):
+        return (expense._id_str, expense.category, expense.description,
+                expense._date_str, expense._amount_str)
+
+    def filter_key(self, expense):
+        return expense._description_lower
+
 # ---------------------------------
 # Dialogs for Adding / Editing Data
 # ---------------------------------
@@ -163,6 +394,15 @@ class InvoiceDialog(QDialog):
                                          self.invoice.due_date.day))
         self.amount_input.setValue(self.invoice.amount)
 
+    def reset_fields(self):
+        """Clear the inputs so a cached add dialog can be shown again."""
+        self.invoice = None
+        self.customer_input.clear()
+        self.invoice_date.setDate(QDate.currentDate())
+        self.due_date.setDate(QDate.currentDate().addDays(30))
+        self.amount_input.setValue(0)
+        self.customer_input.setFocus()
+
     def accept_data(self):
         try:
             customer = self.customer_input.text().strip()
@@ -181,11 +421,9 @@ class InvoiceDialog(QDialog):
                 self.invoice.invoice_date = invoice_date
                 self.invoice.due_date = due_date
                 self.invoice.amount = amount
-                QMessageBox.information(self, "Success", "Invoice updated successfully.")
             else:  # Add mode: create a new invoice
                 # Create the invoice and store it so it can be accessed by the parent
                 self.invoice = Invoice(customer, invoice_date, due_date, amount)
-                QMessageBox.information(self, "Success", "Invoice added successfully.")
             
             self.accept()  # Close the dialog
         except ValueError as e:
@@ -282,6 +520,15 @@ class ExpenseDialog(QDialog):
                                      self.expense.date.day))
         self.amount_input.setValue(self.expense.amount)
 
+    def reset_fields(self):
+        """Clear the inputs so a cached add dialog can be shown again."""
+        self.expense = None
+        self.category_combo.setCurrentIndex(0)
+        self.description_input.clear()
+        self.date_input.setDate(QDate.currentDate())
+        self.amount_input.setValue(0)
+        self.description_input.setFocus()
+
     def accept_data(self):
         try:
             category = self.category_combo.currentText()
@@ -300,11 +547,9 @@ class ExpenseDialog(QDialog):
                 self.expense.description = description
                 self.expense.date = date
                 self.expense.amount = amount
-                QMessageBox.information(self, "Success", "Expense updated successfully.")
             else:
                 # Create the expense and store it so it can be accessed by the parent
                 self.expense = Expense(category, description, date, amount)
-                QMessageBox.information(self, "Success", "Expense added successfully.")
             
             self.accept()  # Close the dialog
         except ValueError as e:
@@ -329,63 +574,83 @@ class DashboardTab(QWidget):
         self.canvas = FigureCanvas(self.figure)
         layout.addWidget(self.canvas)
         self.setLayout(layout)
+        self.build_charts()
         self.plot_charts()
 
-    def plot_charts(self):
-        # Clear the figure
-        self.figure.clear()
-        
+    def build_charts(self):
+        """Create the axes and bar artists once; plot_charts() only updates them."""
         # Set figure background color
         self.figure.patch.set_facecolor('#2c2c2c')
-        
+
         # Create subplots: bar chart on left, pie chart on right
-        ax_bar = self.figure.add_subplot(1, 2, 1)
-        ax_pie = self.figure.add_subplot(1, 2, 2)
-        
+        self.ax_bar = self.figure.add_subplot(1, 2, 1)
+        self.ax_pie = self.figure.add_subplot(1, 2, 2)
+
         # Set axes background colors
-        ax_bar.set_facecolor('#353535')
-        ax_pie.set_facecolor('#353535')
-        
-        # Data calculations
-        total_invoiced = sum(inv.amount for inv in self.parent.invoices)
-        total_paid = sum(inv.amount for inv in self.parent.invoices if inv.status == "Paid")
-        total_expenses = sum(exp.amount for exp in self.parent.expenses)
-        net_profit = total_paid - total_expenses
+        self.ax_bar.set_facecolor('#353535')
+        self.ax_pie.set_facecolor('#353535')
 
-        # Bar Chart Data
+        # Bar Chart (heights are filled in by plot_charts)
         categories = ['Total Invoiced', 'Total Paid', 'Total Expenses', 'Net Profit']
-        values = [total_invoiced, total_paid, total_expenses, net_profit]
         bar_colors = ['#4a90e2', '#50e3c2', '#f5a623', '#7ed321']
+        self.bars = self.ax_bar.bar(categories, [0] * len(categories), color=bar_colors, edgecolor='white')
+        self.ax_bar.set_title("Financial Summary", fontsize=14, color="#dcdcdc")
+        self.ax_bar.tick_params(axis='x', colors="#dcdcdc", labelsize=10)
+        self.ax_bar.tick_params(axis='y', colors="#dcdcdc")
+        for spine in self.ax_bar.spines.values():
+            spine.set_color('#555555')
+        self.ax_bar.grid(True, linestyle='--', alpha=0.5, color='#555555')
+
+        # One value annotation per bar
+        self.annotations = [
+            self.ax_bar.annotate('', 
+                                 xy=(bar.get_x() + bar.get_width() / 2, 0),
+                                 xytext=(0, 3),  # 3 points vertical offset
+                                 textcoords="offset points",
+                                 ha='center', va='bottom',
+                                 color="#dcdcdc", fontsize=10)
+            for bar in self.bars
+        ]
+        self._pie_counts = None
+
+        # Adjust subplot spacing
+        self.figure.subplots_adjust(wspace=0.3)
+
+    def plot_charts(self):
+        self.apply_totals(self.parent.snapshot_totals())
+
+    def apply_totals(self, totals):
+        """Render the charts from a precomputed Totals snapshot."""
+        values = [totals.total_invoiced, totals.total_paid, totals.total_expenses, totals.net_profit]
 
         # Pie Chart Data (Paid vs Unpaid Invoices)
-        paid_count = sum(1 for inv in self.parent.invoices if inv.status == "Paid")
-        unpaid_count = sum(1 for inv in self.parent.invoices if inv.status != "Paid")
-        pie_labels = ['Paid', 'Unpaid'] if (paid_count + unpaid_count) > 0 else []
-        pie_values = [paid_count, unpaid_count] if (paid_count + unpaid_count) > 0 else [0, 0]
+        paid_count = totals.paid_count
+        unpaid_count = totals.unpaid_count
+
+        # Update bar heights and their annotations in place
+        for bar, value, annotation in zip(self.bars, values, self.annotations):
+            bar.set_height(value)
+            annotation.set_text(f'{value:.2f}')
+            annotation.xy = (bar.get_x() + bar.get_width() / 2, value)
+        self.ax_bar.relim()
+        self.ax_bar.autoscale_view()
+
+        # The pie has no cheap in-place update, so only redraw it when the counts change
+        if self._pie_counts != (paid_count, unpaid_count):
+            self._pie_counts = (paid_count, unpaid_count)
+            self.plot_pie(paid_count, unpaid_count)
+
+        self.canvas.draw_idle()
+
+    def plot_pie(self, paid_count, unpaid_count):
+        ax_pie = self.ax_pie
+        ax_pie.clear()
+        ax_pie.set_facecolor('#353535')
         pie_colors = ['#50e3c2', '#f5a623']
 
-        # Bar Chart
-        bars = ax_bar.bar(categories, values, color=bar_colors, edgecolor='white')
-        ax_bar.set_title("Financial Summary", fontsize=14, color="#dcdcdc")
-        ax_bar.tick_params(axis='x', colors="#dcdcdc", labelsize=10)
-        ax_bar.tick_params(axis='y', colors="#dcdcdc")
-        for spine in ax_bar.spines.values():
-            spine.set_color('#555555')
-        ax_bar.grid(True, linestyle='--', alpha=0.5, color='#555555')
-
-        # Annotate each bar with its value
-        for bar in bars:
-            height = bar.get_height()
-            ax_bar.annotate(f'{height:.2f}', 
-                            xy=(bar.get_x() + bar.get_width() / 2, height),
-                            xytext=(0, 3),  # 3 points vertical offset
-                            textcoords="offset points",
-                            ha='center', va='bottom',
-                            color="#dcdcdc", fontsize=10)
-
         # Pie Chart Styling
-        if sum(pie_values) > 0:
-            wedges, texts, autotexts = ax_pie.pie(pie_values, labels=pie_labels, autopct='%1.1f%%', startangle=90, colors=pie_colors,
+        if paid_count + unpaid_count > 0:
+            wedges, texts, autotexts = ax_pie.pie([paid_count, unpaid_count], labels=['Paid', 'Unpaid'], autopct='%1.1f%%', startangle=90, colors=pie_colors,
                                                   textprops={'color': "#dcdcdc", 'fontsize': 10})
             ax_pie.set_title("Invoice Status", fontsize=14, color="#dcdcdc")
             for text in texts:
@@ -395,14 +660,71 @@ class DashboardTab(QWidget):
                         verticalalignment='center', color="#dcdcdc", fontsize=12)
             ax_pie.axis('off')
 
-        # Adjust subplot spacing
-        self.figure.subplots_adjust(wspace=0.3)
-
-        self.canvas.draw()
-
     def refresh(self):
         self.plot_charts()
 
+# ---------------------------------
+# CSV Export Helpers
+# ---------------------------------
+# Field extractors for the export: each returns a record's pre-formatted CSV fields as a tuple
+_INVOICE_CSV_FIELDS = attrgetter("_id_str", "_customer_csv", "_invoice_date_str",
+                                 "_due_date_str", "_amount_str", "status")
+_EXPENSE_CSV_FIELDS = attrgetter("_id_str", "_category_csv", "_description_csv",
+                                 "_date_str", "_amount_str")
+
+
+class CsvExportWorker(QObject):
+    """
+    Writes the CSV export on a background QThread. It works on tuple snapshots
+    of the invoice/expense lists taken by the GUI thread before it starts; the
+    export progress dialog is window-modal, so those records are not edited meanwhile.
+    """
+    progress = pyqtSignal(int)  # number of data rows formatted so far
+    finished = pyqtSignal(str)  # error message, empty on success
+    PROGRESS_STEP = 10000
+
+    def __init__(self, filename, invoices, expenses):
+        super().__init__()
+        self.filename = filename
+        self.invoices = invoices
+        self.expenses = expenses
+        self._done = 0
+
+    def _export_section(self, lines, title, header, rows, fields):
+        """
+        Append one CSV section to lines. fields pulls every pre-formatted field
+        of a record in one call; the tuples are joined per chunk with map(",".join, ...).
+        """
+        lines.append(title)
+        lines.append(header)
+        # Bind the per-chunk callables once outside the loop
+        extend = lines.extend
+        join = ",".join
+        emit = self.progress.emit
+        step = self.PROGRESS_STEP
+        for start in range(0, len(rows), step):
+            chunk = rows[start:start + step]
+            extend(map(join, map(fields, chunk)))
+            self._done += len(chunk)
+            emit(self._done)
+
+    def run(self):
+        try:
+            lines = []
+            self._export_section(lines, "Invoices", "ID,Customer,Invoice Date,Due Date,Amount,Status",
+                                 self.invoices, _INVOICE_CSV_FIELDS)
+            lines.append("")  # Blank row
+            self._export_section(lines, "Expenses", "ID,Category,Description,Date,Amount",
+                                 self.expenses, _EXPENSE_CSV_FIELDS)
+            lines.append("")  # Terminates the last line
+            # Join everything into CRLF-terminated lines and write it in one call
+            with open(self.filename, "w", newline="", buffering=1 << 20, encoding="utf-8") as csvfile:
+                csvfile.write("\r\n".join(lines))
+        except Exception as e:
+            self.finished.emit(str(e))
+        else:
+            self.finished.emit("")
+
 # ---------------------------------
 # Main Application Tabs with Improved Table Styling
 # ---------------------------------
@@ -410,6 +732,7 @@ class InvoicesTab(QWidget):
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent  # reference to main window for accessing invoice list
+        self._add_dialog = None  # built on first use, then reused
         self.setup_ui()
 
     def setup_ui(self):
@@ -426,9 +749,19 @@ class InvoicesTab(QWidget):
         search_layout.addWidget(self.search_edit)
         main_layout.addLayout(search_layout)
 
-        # Table for invoices
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels(["ID", "Customer", "Invoice Date", "Due Date", "Amount", "Status"])
+        # Debounce the search box so a burst of keystrokes filters only once
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+
+        # Table for invoices (filtering on the Customer column is done by the proxy model)
+        self.model = InvoiceTableModel(self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterKeyColumn(1)
+        self.proxy.setFilterRole(InvoiceTableModel.FILTER_ROLE)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         self.table.setSelectionBehavior(self.table.SelectRows)
         self.table.setEditTriggers(self.table.NoEditTriggers)
         
@@ -443,7 +776,7 @@ class InvoicesTab(QWidget):
             }
         """)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #2c2c2c;
                 alternate-background-color: #353535;
                 color: #dcdcdc;
@@ -486,15 +819,20 @@ class InvoicesTab(QWidget):
         self.btn_edit_invoice.clicked.connect(self.edit_invoice)
         self.btn_delete_invoice.clicked.connect(self.delete_invoice)
         self.btn_mark_paid.clicked.connect(self.mark_invoice_paid)
-        self.search_edit.textChanged.connect(self.refresh_table)
+        self._search_timer.timeout.connect(self.apply_filter)
+        self.search_edit.textChanged.connect(self._search_timer.start)
         self.table.doubleClicked.connect(self.edit_invoice)
 
     def open_add_invoice_dialog(self):
-        dialog = InvoiceDialog(self)
+        if self._add_dialog is None:
+            self._add_dialog = InvoiceDialog(self)
+        dialog = self._add_dialog
+        dialog.reset_fields()
         if dialog.exec_() == QDialog.Accepted and dialog.invoice:
-            self.parent.invoices.append(dialog.invoice)
-            self.refresh_table()
-            self.parent.dashboard_tab.refresh()
+            self.parent.add_invoice(dialog.invoice)
+            self.model.append_rows([dialog.invoice])
+            self.parent.schedule_refresh()
+            self.parent.statusBar().showMessage("Invoice added successfully.", 2000)
 
     def edit_invoice(self):
         selected_rows = self.table.selectionModel().selectedRows()
@@ -502,13 +840,15 @@ class InvoicesTab(QWidget):
             QMessageBox.information(self, "No Selection", "Please select an invoice to edit.")
             return
         row = selected_rows[0].row()
-        invoice_id = int(self.table.item(row, 0).text())
-        invoice = next((inv for inv in self.parent.invoices if inv.id == invoice_id), None)
+        invoice_id = int(self.proxy.index(row, 0).data())
+        invoice = self.parent.invoices_by_id.get(invoice_id)
         if invoice:
             dialog = InvoiceDialog(self, invoice)
-            dialog.exec_()
-            self.refresh_table()
-            self.parent.dashboard_tab.refresh()
+            if dialog.exec_() == QDialog.Accepted:
+                self.parent.update_invoice(invoice)
+                self.model.update_rows([invoice], [self.parent.invoice_rows[invoice.id]])
+                self.parent.schedule_refresh()
+                self.parent.statusBar().showMessage("Invoice updated successfully.", 2000)
 
     def delete_invoice(self):
         selected_rows = self.table.selectionModel().selectedRows()
@@ -519,49 +859,41 @@ class InvoicesTab(QWidget):
                                      "Are you sure you want to delete the selected invoice?",
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            for index in selected_rows:
-                row = index.row()
-                invoice_id = int(self.table.item(row, 0).text())
-                self.parent.invoices = [inv for inv in self.parent.invoices if inv.id != invoice_id]
+            invoice_ids = {int(self.proxy.index(index.row(), 0).data()) for index in selected_rows}
+            self.parent.remove_invoices(invoice_ids)
             self.refresh_table()
-            self.parent.dashboard_tab.refresh()
+            self.parent.schedule_refresh()
 
     def mark_invoice_paid(self):
         selected_rows = self.table.selectionModel().selectedRows()
         if not selected_rows:
             QMessageBox.information(self, "No Selection", "Please select an invoice to mark as paid.")
             return
+        updated = []
         for index in selected_rows:
             row = index.row()
-            invoice_id = int(self.table.item(row, 0).text())
-            for invoice in self.parent.invoices:
-                if invoice.id == invoice_id:
-                    invoice.mark_paid()
-                    break
-        self.refresh_table()
-        self.parent.dashboard_tab.refresh()
+            invoice_id = int(self.proxy.index(row, 0).data())
+            invoice = self.parent.invoices_by_id.get(invoice_id)
+            if invoice:
+                self.parent.set_invoice_status(invoice, True)
+                updated.append(invoice)
+        invoice_rows = self.parent.invoice_rows
+        self.model.update_rows(updated, [invoice_rows[inv.id] for inv in updated])
+        self.parent.schedule_refresh()
+
+    def apply_filter(self):
+        # Keys are pre-lowered, so the proxy can do a plain case-sensitive match
+        self.proxy.setFilterFixedString(self.search_edit.text().strip().lower())
 
     def refresh_table(self):
-        filter_text = self.search_edit.text().strip().lower()
-        self.table.setRowCount(0)
-        for invoice in self.parent.invoices:
-            if filter_text and filter_text not in invoice.customer.lower():
-                continue
-            row_pos = self.table.rowCount()
-            self.table.insertRow(row_pos)
-            self.table.setItem(row_pos, 0, QTableWidgetItem(str(invoice.id)))
-            self.table.setItem(row_pos, 1, QTableWidgetItem(invoice.customer))
-            self.table.setItem(row_pos, 2, QTableWidgetItem(invoice.invoice_date.strftime("%Y-%m-%d")))
-            self.table.setItem(row_pos, 3, QTableWidgetItem(invoice.due_date.strftime("%Y-%m-%d")))
-            self.table.setItem(row_pos, 4, QTableWidgetItem(f"{invoice.amount:.2f}"))
-            self.table.setItem(row_pos, 5, QTableWidgetItem(invoice.status))
-        self.table.resizeColumnsToContents()
+        self.model.set_rows(self.parent.invoices)
 
 
 class ExpensesTab(QWidget):
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
+        self._add_dialog = None  # built on first use, then reused
         self.setup_ui()
 
     def setup_ui(self):
@@ -578,9 +910,19 @@ class ExpensesTab(QWidget):
         search_layout.addWidget(self.search_edit)
         main_layout.addLayout(search_layout)
 
-        # Table for expenses
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(["ID", "Category", "Description", "Date", "Amount"])
+        # Debounce the search box so a burst of keystrokes filters only once
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+
+        # Table for expenses (filtering on the Description column is done by the proxy model)
+        self.model = ExpenseTableModel(self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterKeyColumn(2)
+        self.proxy.setFilterRole(ExpenseTableModel.FILTER_ROLE)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         self.table.setSelectionBehavior(self.table.SelectRows)
         self.table.setEditTriggers(self.table.NoEditTriggers)
         
@@ -595,7 +937,7 @@ class ExpensesTab(QWidget):
             }
         """)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #2c2c2c;
                 alternate-background-color: #353535;
                 color: #dcdcdc;
@@ -634,15 +976,20 @@ class ExpensesTab(QWidget):
         self.btn_add_expense.clicked.connect(self.open_add_expense_dialog)
         self.btn_edit_expense.clicked.connect(self.edit_expense)
         self.btn_delete_expense.clicked.connect(self.delete_expense)
-        self.search_edit.textChanged.connect(self.refresh_table)
+        self._search_timer.timeout.connect(self.apply_filter)
+        self.search_edit.textChanged.connect(self._search_timer.start)
         self.table.doubleClicked.connect(self.edit_expense)
 
     def open_add_expense_dialog(self):
-        dialog = ExpenseDialog(self)
+        if self._add_dialog is None:
+            self._add_dialog = ExpenseDialog(self)
+        dialog = self._add_dialog
+        dialog.reset_fields()
         if dialog.exec_() == QDialog.Accepted and dialog.expense:
-            self.parent.expenses.append(dialog.expense)
-            self.refresh_table()
-            self.parent.dashboard_tab.refresh()
+            self.parent.add_expense(dialog.expense)
+            self.model.append_rows([dialog.expense])
+            self.parent.schedule_refresh()
+            self.parent.statusBar().showMessage("Expense added successfully.", 2000)
 
     def edit_expense(self):
         selected_rows = self.table.selectionModel().selectedRows()
@@ -650,13 +997,15 @@ class ExpensesTab(QWidget):
             QMessageBox.information(self, "No Selection", "Please select an expense to edit.")
             return
         row = selected_rows[0].row()
-        expense_id = int(self.table.item(row, 0).text())
-        expense = next((exp for exp in self.parent.expenses if exp.id == expense_id), None)
+        expense_id = int(self.proxy.index(row, 0).data())
+        expense = self.parent.expenses_by_id.get(expense_id)
         if expense:
             dialog = ExpenseDialog(self, expense)
-            dialog.exec_()
-            self.refresh_table()
-            self.parent.dashboard_tab.refresh()
+            if dialog.exec_() == QDialog.Accepted:
+                self.parent.update_expense(expense)
+                self.model.update_rows([expense], [self.parent.expense_rows[expense.id]])
+                self.parent.schedule_refresh()
+                self.parent.statusBar().showMessage("Expense updated successfully.", 2000)
 
     def delete_expense(self):
         selected_rows = self.table.selectionModel().selectedRows()
@@ -667,33 +1016,38 @@ class ExpensesTab(QWidget):
                                      "Are you sure you want to delete the selected expense?",
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            for index in selected_rows:
-                row = index.row()
-                expense_id = int(self.table.item(row, 0).text())
-                self.parent.expenses = [exp for exp in self.parent.expenses if exp.id != expense_id]
+            expense_ids = {int(self.proxy.index(index.row(), 0).data()) for index in selected_rows}
+            self.parent.remove_expenses(expense_ids)
             self.refresh_table()
-            self.parent.dashboard_tab.refresh()
+            self.parent.schedule_refresh()
+
+    def apply_filter(self):
+        # Keys are pre-lowered, so the proxy can do a plain case-sensitive match
+        self.proxy.setFilterFixedString(self.search_edit.text().strip().lower())
 
     def refresh_table(self):
-        filter_text = self.search_edit.text().strip().lower()
-        self.table.setRowCount(0)
-        for expense in self.parent.expenses:
-            if filter_text and filter_text not in expense.description.lower():
-                continue
-            row_pos = self.table.rowCount()
-            self.table.insertRow(row_pos)
-            self.table.setItem(row_pos, 0, QTableWidgetItem(str(expense.id)))
-            self.table.setItem(row_pos, 1, QTableWidgetItem(expense.category))
-            self.table.setItem(row_pos, 2, QTableWidgetItem(expense.description))
-            self.table.setItem(row_pos, 3, QTableWidgetItem(expense.date.strftime("%Y-%m-%d")))
-            self.table.setItem(row_pos, 4, QTableWidgetItem(f"{expense.amount:.2f}"))
-        self.table.resizeColumnsToContents()
+        self.model.set_rows(self.parent.expenses)
+
+# ---------------------------------
+# Reports Tab
+# ---------------------------------
+# Report body, formatted from the attributes of a Totals snapshot
+_REPORT_TEMPLATE = (
+    "<h2 style='color:#F1C40F;'>Financial Report</h2>"
+    "<p><b>Total Invoiced:</b> ${0.total_invoiced:.2f}</p>"
+    "<p><b>Total Paid:</b> ${0.total_paid:.2f}</p>"
+    "<p><b>Total Expenses:</b> ${0.total_expenses:.2f}</p>"
+    "<p><b>Net Profit:</b> ${0.net_profit:.2f}</p>"
+    "<p><b>Estimated Tax (10%):</b> ${0.tax_due:.2f}</p>"
+)
 
 
 class ReportsTab(QWidget):
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
+        self._export_thread = None  # set while a CSV export is running
+        self._closing = False  # set by the main window; suppresses the export result box
         self.setup_ui()
 
     def setup_ui(self):
@@ -717,52 +1071,81 @@ class ReportsTab(QWidget):
 
         self.setLayout(main_layout)
 
+        # Save dialog is built once and reused; it also remembers the last directory
+        self._save_dialog = QFileDialog(self, "Export Data", "", "CSV Files (*.csv)")
+        self._save_dialog.setAcceptMode(QFileDialog.AcceptSave)
+        self._save_dialog.setFileMode(QFileDialog.AnyFile)
+
         self.btn_refresh.clicked.connect(self.generate_report)
         self.btn_export.clicked.connect(self.export_csv)
         self.generate_report()
 
     def generate_report(self):
-        total_invoiced = sum(inv.amount for inv in self.parent.invoices)
-        total_paid = sum(inv.amount for inv in self.parent.invoices if inv.status == "Paid")
-        total_expenses = sum(exp.amount for exp in self.parent.expenses)
-        net_profit = total_paid - total_expenses
-        tax_rate = 0.10
-        tax_due = net_profit * tax_rate if net_profit > 0 else 0
-
-        report_text = (
-            "<h2 style='color:#F1C40F;'>Financial Report</h2>"
-            f"<p><b>Total Invoiced:</b> ${total_invoiced:.2f}</p>"
-            f"<p><b>Total Paid:</b> ${total_paid:.2f}</p>"
-            f"<p><b>Total Expenses:</b> ${total_expenses:.2f}</p>"
-            f"<p><b>Net Profit:</b> ${net_profit:.2f}</p>"
-            f"<p><b>Estimated Tax (10%):</b> ${tax_due:.2f}</p>"
-        )
-        self.label_report.setText(report_text)
+        self.apply_totals(self.parent.snapshot_totals())
+
+    def apply_totals(self, totals):
+        """Render the report from a precomputed Totals snapshot."""
+        self.label_report.setText(_REPORT_TEMPLATE.format(totals))
 
     def export_csv(self):
-        filename, _ = QFileDialog.getSaveFileName(self, "Export Data", "", "CSV Files (*.csv)")
-        if filename:
-            try:
-                with open(filename, "w", newline="") as csvfile:
-                    writer = csv.writer(csvfile)
-                    # Write Invoices section
-                    writer.writerow(["Invoices"])
-                    writer.writerow(["ID", "Customer", "Invoice Date", "Due Date", "Amount", "Status"])
-                    for inv in self.parent.invoices:
-                        writer.writerow([inv.id, inv.customer,
-                                         inv.invoice_date.strftime("%Y-%m-%d"),
-                                         inv.due_date.strftime("%Y-%m-%d"),
-                                         f"{inv.amount:.2f}", inv.status])
-                    writer.writerow([])  # Blank row
-                    # Write Expenses section
-                    writer.writerow(["Expenses"])
-                    writer.writerow(["ID", "Category", "Description", "Date", "Amount"])
-                    for exp in self.parent.expenses:
-                        writer.writerow([exp.id, exp.category, exp.description,
-                                         exp.date.strftime("%Y-%m-%d"), f"{exp.amount:.2f}"])
-                QMessageBox.information(self, "Export CSV", "Data exported successfully.")
-            except Exception as e:
-                QMessageBox.warning(self, "Export CSV", f"An error occurred: {str(e)}")
+        if self._export_thread is not None:
+            return  # an export is already in progress
+        if self._save_dialog.exec_() != QDialog.Accepted:
+            return
+        filename = self._save_dialog.selectedFiles()[0]
+        # Tuple snapshots taken on the GUI thread: rows added or deleted while the
+        # worker runs cannot change which records it iterates
+        invoices = tuple(self.parent.invoices)
+        expenses = tuple(self.parent.expenses)
+
+        self._export_progress = QProgressDialog("Exporting data...", None, 0,
+                                                len(invoices) + len(expenses), self)
+        self._export_progress.setWindowTitle("Export CSV")
+        # The worker reads the records' cached fields, so block every edit dialog
+        # until it is done. Shown at once: modality only applies once it is visible.
+        self._export_progress.setWindowModality(Qt.WindowModal)
+        self._export_progress.setValue(0)
+        self._export_progress.show()
+
+        self._export_thread = QThread(self)
+        self._export_worker = CsvExportWorker(filename, invoices, expenses)
+        self._export_worker.moveToThread(self._export_thread)
+        self._export_thread.started.connect(self._export_worker.run)
+        self._export_worker.progress.connect(self._export_progress.setValue)
+        self._export_worker.finished.connect(self.on_export_finished)
+        # Direct, so the thread can stop even while the GUI thread is blocked in wait_for_export
+        self._export_worker.finished.connect(self._export_thread.quit, Qt.DirectConnection)
+        # Only drop the references once the thread itself has stopped
+        self._export_thread.finished.connect(self.on_export_thread_finished)
+        self._export_thread.finished.connect(self._export_worker.deleteLater)
+        self._export_thread.finished.connect(self._export_thread.deleteLater)
+        self.btn_export.setEnabled(False)
+        self._export_thread.start()
+
+    def wait_for_export(self):
+        """
+        Block until a running export has written its file and its thread has
+        stopped. Used while the window closes, so no result box is shown.
+        """
+        self._closing = True
+        if self._export_thread is not None:
+            self._export_thread.wait()
+
+    def on_export_thread_finished(self):
+        self._export_thread = None
+        self._export_worker = None
+        self.btn_export.setEnabled(True)
+
+    def on_export_finished(self, error):
+        self._export_progress.close()
+        self._export_progress.deleteLater()
+        self._export_progress = None
+        if self._closing:
+            return
+        if error:
+            QMessageBox.warning(self, "Export CSV", f"An error occurred: {error}")
+        else:
+            QMessageBox.information(self, "Export CSV", "Data exported successfully.")
 
 # ---------------------------------
 # Main Window with Menu/Toolbar
@@ -773,9 +1156,35 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Invoicing & Accounting")
         self.resize(950, 700)
         
-        # In-memory storage for invoices and expenses
+        # In-memory storage for invoices and expenses, plus id lookups kept in sync
         self.invoices = []
         self.expenses = []
+        self.invoices_by_id = {}
+        self.expenses_by_id = {}
+        # Row of each id in the lists/column arrays, rebuilt whenever rows are removed
+        self.invoice_rows = {}
+        self.expense_rows = {}
+
+        # Column arrays parallel to the lists above, used for the dashboard totals.
+        # They grow geometrically; only the first len(list) entries are live.
+        self.invoice_amounts = np.empty(0, dtype=np.float64)
+        self.invoice_paid_mask = np.empty(0, dtype=bool)
+        self.expense_amounts = np.empty(0, dtype=np.float64)
+
+        # Running totals, adjusted incrementally by the add/update/remove helpers
+        self.total_invoiced = 0.0
+        self.total_paid = 0.0
+        self.total_expenses = 0.0
+        self.paid_count = 0
+
+        # Set when the data changes; the dashboard only replots once it is visible
+        self._dashboard_dirty = False
+
+        # Debounces report/dashboard refreshes after a burst of data changes
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(100)
+        self._refresh_timer.timeout.connect(self._refresh_totals_views)
 
         self.setup_ui()
         self.create_menu_toolbar()
@@ -788,14 +1197,30 @@ class MainWindow(QMainWindow):
         self.dashboard_tab = DashboardTab(self)
         self.invoices_tab = InvoicesTab(self)
         self.expenses_tab = ExpensesTab(self)
-        self.reports_tab = ReportsTab(self)
+        self.reports_tab = None  # built on first visit, see _build_reports_tab
 
         self.tabs.addTab(self.dashboard_tab, "Dashboard")
         self.tabs.addTab(self.invoices_tab, "Invoices")
         self.tabs.addTab(self.expenses_tab, "Expenses")
-        self.tabs.addTab(self.reports_tab, "Reports")
+        self._reports_index = self.tabs.addTab(QWidget(), "Reports")  # placeholder
 
         self.setCentralWidget(self.tabs)
+        self.tabs.currentChanged.connect(self._build_reports_tab)
+        self.tabs.currentChanged.connect(self._maybe_refresh_dashboard)
+
+    def _build_reports_tab(self, index):
+        """Replace the Reports placeholder with the real tab the first time it is selected."""
+        if index != self._reports_index or self.reports_tab is not None:
+            return
+        self.reports_tab = ReportsTab(self)
+        placeholder = self.tabs.widget(index)
+        # Swapping the widgets would re-emit currentChanged; keep that quiet
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, self.reports_tab, "Reports")
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
 
     def create_menu_toolbar(self):
         # Create a toolbar with common actions
@@ -828,120 +1253,274 @@ class MainWindow(QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
+    def closeEvent(self, event):
+        # A running export thread must not be destroyed along with the window
+        if self.reports_tab is not None:
+            self.reports_tab.wait_for_export()
+        super().closeEvent(event)
+
+    def schedule_refresh(self):
+        """
+        Called after data changes. Each call restarts a short single-shot timer,
+        so a burst of changes refreshes the report and dashboard only once.
+        """
+        self._dashboard_dirty = True
+        self._refresh_timer.start()
+
+    def _refresh_totals_views(self):
+        totals = self.snapshot_totals()
+        if self.reports_tab is not None:
+            self.reports_tab.apply_totals(totals)
+        # A hidden dashboard stays dirty and is replotted when it is next shown
+        if self.tabs.currentWidget() is self.dashboard_tab:
+            self._dashboard_dirty = False
+            self.dashboard_tab.apply_totals(totals)
+
+    def _maybe_refresh_dashboard(self, index=None):
+        if self._dashboard_dirty and self.tabs.currentWidget() is self.dashboard_tab:
+            self._dashboard_dirty = False
+            self.dashboard_tab.refresh()
+
+    def add_invoice(self, invoice):
+        n = len(self.invoices)
+        self.invoice_amounts = _ensure_capacity(self.invoice_amounts, n + 1)
+        self.invoice_paid_mask = _ensure_capacity(self.invoice_paid_mask, n + 1)
+        self.invoice_amounts[n] = invoice.amount
+        self.invoice_paid_mask[n] = invoice.paid
+        self.invoices.append(invoice)
+        self.invoices_by_id[invoice.id] = invoice
+        self.invoice_rows[invoice.id] = n
+        self.total_invoiced += invoice.amount
+        if invoice.paid:
+            self.total_paid += invoice.amount
+            self.paid_count += 1
+
+    def update_invoice(self, invoice):
+        """Sync the column arrays and totals after an invoice was edited."""
+        i = self.invoice_rows[invoice.id]
+        # The arrays still hold the previous values, so swap the old contribution for the new one
+        old_amount = float(self.invoice_amounts[i])
+        self.total_invoiced += invoice.amount - old_amount
+        if self.invoice_paid_mask[i]:
+            self.total_paid -= old_amount
+            self.paid_count -= 1
+        if invoice.paid:
+            self.total_paid += invoice.amount
+            self.paid_count += 1
+        self.invoice_amounts[i] = invoice.amount
+        self.invoice_paid_mask[i] = invoice.paid
+
+    def set_invoice_status(self, invoice, paid):
+        """Set an invoice's paid flag, moving its amount into or out of total_paid."""
+        if invoice.paid == paid:
+            return
+        if paid:
+            invoice.mark_paid()
+            self.total_paid += invoice.amount
+            self.paid_count += 1
+        else:
+            invoice.mark_unpaid()
+            self.total_paid -= invoice.amount
+            self.paid_count -= 1
+        self.invoice_paid_mask[self.invoice_rows[invoice.id]] = paid
+
+    def remove_invoices(self, invoice_ids):
+        """Remove all invoices whose id is in the given set, with one set-based filter."""
+        for invoice_id in invoice_ids:
+            self.invoices_by_id.pop(invoice_id, None)
+        n = len(self.invoices)
+        keep = np.fromiter((inv.id not in invoice_ids for inv in self.invoices), dtype=bool, count=n)
+        self.invoices = [inv for inv, kept in zip(self.invoices, keep) if kept]
+        self.invoice_rows = {inv.id: i for i, inv in enumerate(self.invoices)}
+        # Compact the column arrays in place; their capacity is kept for later adds
+        m = len(self.invoices)
+        self.invoice_amounts[:m] = self.invoice_amounts[:n][keep]
+        self.invoice_paid_mask[:m] = self.invoice_paid_mask[:n][keep]
+        self._resync_totals()
+
+    def invoice_columns(self):
+        """Return views of the amount and paid-flag arrays covering the live invoices."""
+        n = len(self.invoices)
+        return self.invoice_amounts[:n], self.invoice_paid_mask[:n]
+
+    def add_expense(self, expense):
+        n = len(self.expenses)
+        self.expense_amounts = _ensure_capacity(self.expense_amounts, n + 1)
+        self.expense_amounts[n] = expense.amount
+        self.expenses.append(expense)
+        self.expenses_by_id[expense.id] = expense
+        self.expense_rows[expense.id] = n
+        self.total_expenses += expense.amount
+
+    def update_expense(self, expense):
+        """Sync the amount array and total after an expense was edited."""
+        i = self.expense_rows[expense.id]
+        self.total_expenses += expense.amount - float(self.expense_amounts[i])
+        self.expense_amounts[i] = expense.amount
+
+    def remove_expenses(self, expense_ids):
+        """Remove all expenses whose id is in the given set, with one set-based filter."""
+        for expense_id in expense_ids:
+            self.expenses_by_id.pop(expense_id, None)
+        n = len(self.expenses)
+        keep = np.fromiter((exp.id not in expense_ids for exp in self.expenses), dtype=bool, count=n)
+        self.expenses = [exp for exp, kept in zip(self.expenses, keep) if kept]
+        self.expense_rows = {exp.id: i for i, exp in enumerate(self.expenses)}
+        m = len(self.expenses)
+        self.expense_amounts[:m] = self.expense_amounts[:n][keep]
+        self._resync_totals()
+
+    def expense_column(self):
+        """Return a view of the amount array covering the live expenses."""
+        return self.expense_amounts[:len(self.expenses)]
+
+    def _resync_totals(self):
+        """
+        Recompute the running totals from the column arrays. Deletes already
+        touch every row, so they resync instead of subtracting, which also
+        discards rounding error from the incremental add/edit updates.
+        """
+        amounts, paid_mask = self.invoice_columns()
+        self.total_invoiced, self.total_paid, self.total_expenses = _compute_totals(
+            amounts, paid_mask, self.expense_column())
+        self.paid_count = int(np.count_nonzero(paid_mask))
+
+    def snapshot_totals(self):
+        """Collect the running totals and invoice counts into a Totals snapshot."""
+        net_profit = self.total_paid - self.total_expenses
+        tax_rate = 0.10
+        paid_count = self.paid_count
+        return Totals(
+            total_invoiced=self.total_invoiced,
+            total_paid=self.total_paid,
+            total_expenses=self.total_expenses,
+            net_profit=net_profit,
+            tax_due=net_profit * tax_rate if net_profit > 0 else 0,
+            paid_count=paid_count,
+            unpaid_count=len(self.invoices) - paid_count,
+        )
+
     def refresh_all(self):
         self.invoices_tab.refresh_table()
         self.expenses_tab.refresh_table()
-        self.reports_tab.generate_report()
-        self.dashboard_tab.refresh()
+        # Compute the totals once and hand the same snapshot to both tabs
+        totals = self.snapshot_totals()
+        if self.reports_tab is not None:
+            self.reports_tab.apply_totals(totals)
+        self.dashboard_tab.apply_totals(totals)
+        self._dashboard_dirty = False
+
+# ---------------------------------
+# Application Stylesheet
+# ---------------------------------
+# Premium dark-themed application stylesheet with refined colors
+APP_STYLESHEET = """
+/* Main Window */
+QMainWindow {
+    background-color: #1e1e2f;
+}
+
+/* General Widgets */
+QWidget {
+    font-family: "Segoe UI", sans-serif;
+    font-size: 15px;
+    color: #dcdcdc;
+    background-color: #1e1e2f;
+}
+QLabel {
+    color: #dcdcdc;
+}
+
+/* QPushButton */
+QPushButton {
+    background-color: #3a3f58;
+    border: 1px solid #4a90e2;
+    border-radius: 5px;
+    padding: 8px 16px;
+    color: #ffffff;
+    min-width: 100px;
+}
+QPushButton:hover {
+    background-color: #4a90e2;
+}
+QPushButton:pressed {
+    background-color: #357ABD;
+}
+
+/* QLineEdit, QDateEdit, QComboBox */
+QLineEdit, QDateEdit, QComboBox {
+    background-color: #2b2b3d;
+    color: #dcdcdc;
+    border: 1px solid #4a4a6a;
+    border-radius: 4px;
+    padding: 6px;
+}
+
+/* QTableView */
+QTableView {
+    background-color: #2b2b3d;
+    color: #dcdcdc;
+    gridline-color: #3a3f58;
+    border: none;
+}
+QTableView::item {
+    padding: 4px;
+}
+QTableView QHeaderView::section {
+    background-color: #3a3f58;
+    color: #ffffff;
+    padding: 8px;
+    border: none;
+}
+
+/* QTabWidget */
+QTabWidget::pane {
+    border: none;
+}
+QTabBar::tab {
+    background: #2b2b3d;
+    border: 1px solid #4a4a6a;
+    padding: 10px 20px;
+    margin: 2px;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+    min-width: 120px;
+}
+QTabBar::tab:selected {
+    background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 #4a90e2, stop:1 #357ABD);
+    border-bottom: 2px solid #4a90e2;
+}
+QTabBar::tab:hover {
+    background: #4a90e2;
+}
+
+/* QMessageBox */
+QMessageBox {
+    background-color: #1e1e2f;
+    color: #dcdcdc;
+}
+
+/* QDialog */
+QDialog {
+    background-color: #2b2b3d;
+}
+QDialog QLineEdit, QDialog QDateEdit, QDialog QComboBox {
+    background-color: #3a3f58;
+}
+QDialog QPushButton {
+    background-color: #357ABD;
+}
+QDialog QPushButton:hover {
+    background-color: #4a90e2;
+}
+"""
 
 # ---------------------------------
 # Main Function
 # ---------------------------------
 def main():
     app = QApplication(sys.argv)
-    
-    # Apply a premium dark-themed stylesheet with refined colors
-    style = """
-    /* Main Window */
-    QMainWindow {
-        background-color: #1e1e2f;
-    }
-
-    /* General Widgets */
-    QWidget {
-        font-family: "Segoe UI", sans-serif;
-        font-size: 15px;
-        color: #dcdcdc;
-        background-color: #1e1e2f;
-    }
-    QLabel {
-        color: #dcdcdc;
-    }
-
-    /* QPushButton */
-    QPushButton {
-        background-color: #3a3f58;
-        border: 1px solid #4a90e2;
-        border-radius: 5px;
-        padding: 8px 16px;
-        color: #ffffff;
-        min-width: 100px;
-    }
-    QPushButton:hover {
-        background-color: #4a90e2;
-    }
-    QPushButton:pressed {
-        background-color: #357ABD;
-    }
-
-    /* QLineEdit, QDateEdit, QComboBox */
-    QLineEdit, QDateEdit, QComboBox {
-        background-color: #2b2b3d;
-        color: #dcdcdc;
-        border: 1px solid #4a4a6a;
-        border-radius: 4px;
-        padding: 6px;
-    }
-
-    /* QTableWidget */
-    QTableWidget {
-        background-color: #2b2b3d;
-        color: #dcdcdc;
-        gridline-color: #3a3f58;
-        border: none;
-    }
-    QTableWidget::item {
-        padding: 4px;
-    }
-    QTableWidget QHeaderView::section {
-        background-color: #3a3f58;
-        color: #ffffff;
-        padding: 8px;
-        border: none;
-    }
-
-    /* QTabWidget */
-    QTabWidget::pane {
-        border: none;
-    }
-    QTabBar::tab {
-        background: #2b2b3d;
-        border: 1px solid #4a4a6a;
-        padding: 10px 20px;
-        margin: 2px;
-        border-top-left-radius: 4px;
-        border-top-right-radius: 4px;
-        min-width: 120px;
-    }
-    QTabBar::tab:selected {
-        background: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 #4a90e2, stop:1 #357ABD);
-        border-bottom: 2px solid #4a90e2;
-    }
-    QTabBar::tab:hover {
-        background: #4a90e2;
-    }
-
-    /* QMessageBox */
-    QMessageBox {
-        background-color: #1e1e2f;
-        color: #dcdcdc;
-    }
-
-    /* QDialog */
-    QDialog {
-        background-color: #2b2b3d;
-    }
-    QDialog QLineEdit, QDialog QDateEdit, QDialog QComboBox {
-        background-color: #3a3f58;
-    }
-    QDialog QPushButton {
-        background-color: #357ABD;
-    }
-    QDialog QPushButton:hover {
-        background-color: #4a90e2;
-    }
-    """
-    app.setStyleSheet(style)
+    app.setStyleSheet(APP_STYLESHEET)
 
     window = MainWindow()
     window.showMaximized()  # Launch in full-screen (maximized)